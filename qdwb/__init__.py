@@ -1,2 +1,4 @@
 from .check import *
+from .global_variables import *
+from .radiation import *
 from .reference_evapotranspiration import *
\ No newline at end of file
@@ -1,21 +1,77 @@
 from typing import List, Dict, Tuple, Set, Optional, Union, Any, NoReturn
+import os
+import math
+import numpy as np
+
+# Set QDWB_VALIDATE=0 (or false / no) To Skip Input Validation in Hot Loops
+# (Except The Day of The Year, Which Indexes Lookup Tables and Is Always Checked);
+# Other Modules Read This Flag Through The Module So Runtime Patches Apply
+_VALIDATE = os.environ.get("QDWB_VALIDATE", "1").strip().lower() not in ("0", "false", "no")
+
+_HALF_PI = math.pi / 2
+
+__all__ = [
+    "check_greater_than",
+    "check_between",
+    "check_julian_day",
+    "check_latitude_radians",
+]
 
 def check_greater_than(
     a: float,
     a_name: str,
     b: float,
     b_name: str,
-) -> NoReturn:
+) -> None:
+    if not _VALIDATE:
+        return
     if a > b:
         raise ValueError(f"{a_name} is greater than {b_name}!")
 
 
 def check_between(
     a: float,
-    min: float,
-    max: float,
+    lo: float,
+    hi: float,
     name: str,
-) -> NoReturn:
-    if a < min or a > max:
-        raise ValueError(f"{name} must be between {min} and {max}!")
-    
\ No newline at end of file
+) -> None:
+    if not _VALIDATE:
+        return
+    if a < lo or a > hi:
+        raise ValueError(f"{name} must be between {lo} and {hi}!")
+
+
+def check_julian_day(
+    day_of_year: Union[int, np.ndarray],
+) -> None:
+    # Not Skipped When _VALIDATE Is Off: Out-of-Range Days Would Silently Index
+    # (or Wrap Around) The Solar Lookup Tables
+    # bool Subclasses int, But Indexing a Table With It Acts As a Mask
+    if isinstance(day_of_year, bool):
+        raise ValueError("Day of The Year must be an integer!")
+    # Plain Comparisons For Scalars; np.asarray Costs Microseconds Per Call
+    if isinstance(day_of_year, (int, np.integer)):
+        if day_of_year < 1 or day_of_year > 366:
+            raise ValueError("Day of The Year must be between 1 and 366!")
+        return
+    day_of_year = np.asarray(day_of_year)
+    # Day of The Year Indexes The Solar Lookup Tables, So It Must Be Integral
+    if not np.issubdtype(day_of_year.dtype, np.integer):
+        raise ValueError("Day of The Year must be an integer!")
+    if ((day_of_year < 1) | (day_of_year > 366)).any():
+        raise ValueError("Day of The Year must be between 1 and 366!")
+
+
+def check_latitude_radians(
+    latitude: Union[float, np.ndarray],
+) -> None:
+    if not _VALIDATE:
+        return
+    if isinstance(latitude, (int, float, np.number)):
+        if latitude < -_HALF_PI or latitude > _HALF_PI:
+            raise ValueError(f"Latitude must be between {-_HALF_PI} and {_HALF_PI} radians!")
+        return
+    latitude = np.asarray(latitude)
+    if ((latitude < -_HALF_PI) | (latitude > _HALF_PI)).any():
+        raise ValueError(f"Latitude must be between {-_HALF_PI} and {_HALF_PI} radians!")
+    
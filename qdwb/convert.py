@@ -1,6 +1,10 @@
 
 from typing import List, Dict, Tuple, Set, Optional, Union, Any, NoReturn
 import math
+from .global_variables import RADIATION2EVAPORATION
+
+_DEGREES2RADIANS = math.pi / 180.0
+_RADIANS2DEGREES = 180.0 / math.pi
 
 
 def convert_celsius2kelvin(
@@ -71,7 +75,7 @@ def convert_degrees2radians(
         Value in Radians
     """
     
-    return degrees * (math.pi / 180.0)
+    return degrees * _DEGREES2RADIANS
 
 
 
@@ -95,7 +99,7 @@ def convert_radians2degrees(
         Value in Degrees
     """
     
-    return radians * (180.0 / math.pi)
+    return radians * _RADIANS2DEGREES
 
 
 
@@ -120,4 +124,4 @@ def convert_radiation2evaporation(
         Equivalent Evaporation in mm/day
     """
     
-    return radiation * 0.408
\ No newline at end of file
+    return radiation * RADIATION2EVAPORATION
\ No newline at end of file
@@ -1,3 +0,0 @@
-
-# Solar Constant [ MJ m-2 min-1]
-SOLAR_CONSTANT = 0.0820
\ No newline at end of file
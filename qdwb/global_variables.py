@@ -0,0 +1,6 @@
+
+# Solar Constant [ MJ m-2 min-1]
+SOLAR_CONSTANT = 0.0820
+
+# Radiation To Equivalent Evaporation Factor [mm day-1 / MJ m-2 day-1]
+RADIATION2EVAPORATION = 0.408
\ No newline at end of file
@@ -0,0 +1,151 @@
+
+from typing import List, Dict, Tuple, Set, Optional, Union, Any, NoReturn
+import math
+import numpy as np
+from .check import check_julian_day, check_latitude_radians
+from .global_variables import SOLAR_CONSTANT
+
+__all__ = [
+    "solar_declination",
+    "inverse_relative_distance_earth_sun",
+    "sunset_hour_angle",
+    "extraterrestrial_radiation",
+]
+
+# Constant Factor Of Equation 21 in Allen et al (1998) [MJ m-2 day-1]
+_RA_COEFF = (24.0 * 60.0) / math.pi * SOLAR_CONSTANT
+
+_TWO_PI_OVER_365 = 2.0 * math.pi / 365.0
+
+# Solar Declination and Inverse Relative Distance Earth-Sun Depend Only on The
+# Day of The Year, So Both Are Tabulated Once (Index 0 Is Unused and Holds NaN)
+_DAYS = np.arange(367)
+_SD_TABLE = 0.409 * np.sin(_TWO_PI_OVER_365 * _DAYS - 1.39)
+_IRDES_TABLE = 1 + 0.033 * np.cos(_TWO_PI_OVER_365 * _DAYS)
+_SD_TABLE[0] = _IRDES_TABLE[0] = np.nan
+
+
+def solar_declination(
+    day_of_year : Union[int, np.ndarray]
+) -> Union[float, np.ndarray]:
+    
+    """
+    Description
+    -----------
+    Calculate Solar Declination From Day of The Year.
+    **Reference**: Based on Equation 24 in Allen et al (1998).
+    
+    Parameters
+    ----------
+    day_of_year : int or numpy.ndarray
+        Day of The Year Between 1 and 366
+    
+    Returns
+    -------
+    solar_dec : float or numpy.ndarray
+        Solar Declination [rad]
+    """
+    
+    check_julian_day(day_of_year)
+    
+    return _SD_TABLE[day_of_year]
+
+
+
+def inverse_relative_distance_earth_sun(
+    day_of_year : Union[int, np.ndarray]
+) -> Union[float, np.ndarray]:
+    
+    """
+    Description
+    -----------
+    Calculate Inverse Relative Distance Earth-Sun From Day of The Year.
+    **Reference**: Based on Equation 23 in Allen et al (1998).
+    
+    Parameters
+    ----------
+    day_of_year : int or numpy.ndarray
+        Day of The Year Between 1 and 366
+    
+    Returns
+    -------
+    irdes : float or numpy.ndarray
+        Inverse Relative Distance Earth-Sun [-]
+    """
+    
+    check_julian_day(day_of_year)
+    
+    return _IRDES_TABLE[day_of_year]
+
+
+
+def sunset_hour_angle(
+    latitude : Union[float, np.ndarray],
+    solar_dec : Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    
+    """
+    Description
+    -----------
+    Calculate Sunset Hour Angle From Latitude and Solar Declination.
+    **Reference**: Based on Equation 25 in Allen et al (1998).
+    
+    Parameters
+    ----------
+    latitude : float or numpy.ndarray
+        Latitude [rad]
+    
+    solar_dec : float or numpy.ndarray
+        Solar Declination [rad]
+    
+    Returns
+    -------
+    sha : float or numpy.ndarray
+        Sunset Hour Angle [rad]
+    """
+    
+    check_latitude_radians(latitude)
+    
+    # Clip Guards The Polar Day / Night Cases Where |tan(lat) * tan(dec)| > 1
+    return np.arccos(np.clip(-np.tan(latitude) * np.tan(solar_dec), -1.0, 1.0))
+
+
+
+def extraterrestrial_radiation(
+    day_of_year : Union[int, np.ndarray],
+    latitude : Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    
+    """
+    Description
+    -----------
+    Calculate Daily Extraterrestrial Radiation For a Given Latitude.
+    **Reference**: Based on Equation 21 in Allen et al (1998).
+    
+    Parameters
+    ----------
+    day_of_year : int or numpy.ndarray
+        Day of The Year Between 1 and 366
+    
+    latitude : float or numpy.ndarray
+        Latitude [rad]
+    
+    Returns
+    -------
+    ra : float or numpy.ndarray
+        Extraterrestrial Radiation [MJ m-2 day-1]
+    """
+    
+    check_julian_day(day_of_year)
+    check_latitude_radians(latitude)
+    
+    solar_dec = _SD_TABLE[day_of_year]
+    irdes = _IRDES_TABLE[day_of_year]
+    
+    # Sin and Cos of Latitude and Solar Declination Are Shared By Equations 21
+    # and 25, So The Sunset Hour Angle Is Derived From Them Instead of Two Tan Calls
+    sl, cl = np.sin(latitude), np.cos(latitude)
+    ssd, csd = np.sin(solar_dec), np.cos(solar_dec)
+    sha = np.arccos(np.clip(-(sl * ssd) / (cl * csd), -1.0, 1.0))
+    
+    return _RA_COEFF * irdes * (sha * sl * ssd + cl * csd * np.sin(sha))
@@ -1,14 +1,109 @@
 
-from typing import List, Dict, Tuple, Set, Optional, Union, Any, NoReturn
-from .check import *
-from .global_variables import *
+from typing import List, Dict, Tuple, Set, Optional, Union, Any, NoReturn, Callable
+from . import check as _check
+from .check import check_julian_day, check_latitude_radians
+from .global_variables import SOLAR_CONSTANT, RADIATION2EVAPORATION
+from .radiation import extraterrestrial_radiation, _RA_COEFF, _DAYS, _SD_TABLE, _IRDES_TABLE
+from math import sin, cos, acos, sqrt
+import functools
+import numpy as np
+
+
+__all__ = [
+    "ReferenceEvapotranspiration",
+    "hargreaves_samani",
+    "hargreaves_samani_array",
+    "hargreaves_samani_from_latitude",
+    "hargreaves_samani_for_latitude",
+    "fao56_penman_monteith",
+    "fao56_penman_monteith_array",
+]
+
+# Upper Bound of Extraterrestrial Radiation [mm day-1]
+_RA_MAX = SOLAR_CONSTANT * 24 * 60 * RADIATION2EVAPORATION
+
+# Constant Factor of Equation 21 in Allen et al (1998) Expressed in [mm day-1]
+_RA_COEFF_MM = _RA_COEFF * RADIATION2EVAPORATION
+
+
+def _clamp(x, lo, hi):
+    return lo if x < lo else hi if x > hi else x
+
+
+def _hargreaves_samani_kernel(tmin, tmax, tmean, ra):
+    return 0.0023 * (tmean + 17.8) * np.sqrt(tmax - tmin) * ra
+
+
+def _fao56_penman_monteith_kernel(delta, rn, G, gamma, tmean, u2, es, ea):
+    A = 0.408 * delta * (rn - G)
+    B = gamma * (900.0 / (tmean + 273.0)) * u2 * (es - ea)
+    C = delta + gamma * (1.0 + 0.34 * u2)
+    
+    return (A + B) / C
+
+
+def _hargreaves_samani_from_latitude_kernel(day_of_year, latitude, tmin, tmax, tmean):
+    # Always Checked: Numba Does Not Bounds-Check The Table Lookups Below
+    if day_of_year < 1 or day_of_year > 366:
+        raise ValueError("Day of The Year must be between 1 and 366!")
+    
+    sl, cl = sin(latitude), cos(latitude)
+    solar_dec = _SD_TABLE[day_of_year]
+    ssd, csd = sin(solar_dec), cos(solar_dec)
+    sha = acos(_clamp(-sl * ssd / (cl * csd), -1.0, 1.0))
+    irdes = _IRDES_TABLE[day_of_year]
+    
+    return 0.0023 * (tmean + 17.8) * sqrt(tmax - tmin) * _RA_COEFF_MM * irdes * (
+        sha * sl * ssd + cl * csd * sin(sha)
+    )
+
+
+# Numba Is Optional (pip install qdwb[numba]): When Installed The Kernels Above Are
+# Compiled To Native Code, Otherwise The Plain NumPy / Python Versions Are Used.
+# Numba Is Imported and The Kernels Compiled on First Use, Not With qdwb, Since
+# Importing Numba Alone Takes Several Hundred Milliseconds
+@functools.lru_cache(maxsize=None)
+def _numba():
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+@functools.lru_cache(maxsize=None)
+def _hargreaves_samani_ufunc():
+    numba = _numba()
+    if numba is None:
+        return _hargreaves_samani_kernel
+    return numba.vectorize(["f8(f8, f8, f8, f8)"], cache=True)(_hargreaves_samani_kernel)
+
+
+@functools.lru_cache(maxsize=None)
+def _fao56_penman_monteith_ufunc():
+    numba = _numba()
+    if numba is None:
+        return _fao56_penman_monteith_kernel
+    return numba.vectorize(["f8(f8, f8, f8, f8, f8, f8, f8, f8)"], cache=True)(_fao56_penman_monteith_kernel)
+
+
+@functools.lru_cache(maxsize=None)
+def _hargreaves_samani_from_latitude_compiled():
+    global _clamp
+    numba = _numba()
+    if numba is None:
+        return _hargreaves_samani_from_latitude_kernel
+    # The Kernel Calls _clamp, Which Numba Resolves as a Global When Compiling
+    _clamp = numba.njit(cache=True)(_clamp)
+    return numba.njit(cache=True)(_hargreaves_samani_from_latitude_kernel)
+
 
 class ReferenceEvapotranspiration():
     
-    def __init__(self):
-        pass
-        
+    # Stateless: All Methods Are Static, So Instances Carry No __dict__
+    __slots__ = ()
     
+    @staticmethod
     def hargreaves_samani(
         tmin : float,
         tmax : float,
@@ -20,6 +115,7 @@ class ReferenceEvapotranspiration():
         Description
         -----------
         Estimate Reference Crop Evapotranspiration (ETo) Using the Hargreaves and Samani Method.
+        NaN Inputs Are Not Validated and Propagate To a NaN Result.
         **Reference**: Based on Equation 4 in Hargreaves and Samani (1985).
         
         Parameters
@@ -42,37 +138,172 @@ class ReferenceEvapotranspiration():
             Reference Crop Evapotranspiration [mm/day]
         """
         
-        check_greater_than(
-            a=tmin,
-            a_name="Tmin",
-            b=tmax,
-            b_name="Tmax"
-        )
+        if _check._VALIDATE:
+            # Comparisons With NaN Are False, So NaN Inputs Pass and Propagate
+            if tmin > tmean or tmean > tmax or tmin > tmax:
+                raise ValueError("Tmin, Tmean and Tmax must satisfy Tmin <= Tmean <= Tmax!")
+            if ra < 0.0 or ra > _RA_MAX:
+                raise ValueError(f"Extraterrestrial Radiation must be between 0 and {_RA_MAX}!")
         
-        check_greater_than(
-            a=tmean,
-            a_name="Tmean",
-            b=tmax,
-            b_name="Tmax"
-        )
+        return 0.0023 * (tmean + 17.8) * sqrt(tmax - tmin) * ra
+    
+    
+    @staticmethod
+    def hargreaves_samani_array(
+        tmin : np.ndarray,
+        tmax : np.ndarray,
+        tmean : np.ndarray,
+        ra : np.ndarray
+    ) -> np.ndarray:
         
-        check_greater_than(
-            a=tmin,
-            a_name="Tmin",
-            b=tmean,
-            b_name="Tmean"
-        )
+        """
+        Description
+        -----------
+        Estimate Reference Crop Evapotranspiration (ETo) Using the Hargreaves and Samani Method
+        For Arrays of Daily Values (e.g. a Time Series or a Raster). NaN Inputs (e.g. Nodata)
+        Are Not Validated and Propagate To NaN in The Corresponding Output Elements.
+        **Reference**: Based on Equation 4 in Hargreaves and Samani (1985).
         
-        check_between(
-            a=ra,
-            min=0,
-            max=SOLAR_CONSTANT * 24 * 60 * 0.408,
-            name="Extraterrestrial Radiation"
-        )
+        Parameters
+        ----------
+        tmin : numpy.ndarray
+            Minimum Daily Temperature [°C]
         
-        return 0.0023 * (tmean + 17.8) * (tmax - tmin) ** 0.5 * ra
+        tmax : numpy.ndarray
+            Maximum Daily Temperature [°C]
+        
+        tmean : numpy.ndarray
+            Mean Daily Temperature [°C]
+        
+        ra : numpy.ndarray
+            Extraterrestrial Radiation [mm day-1]
+            
+        Returns
+        -------
+        ETo : numpy.ndarray
+            Reference Crop Evapotranspiration [mm/day]
+        """
+        
+        tmin = np.asarray(tmin, dtype=np.float64)
+        tmax = np.asarray(tmax, dtype=np.float64)
+        tmean = np.asarray(tmean, dtype=np.float64)
+        ra = np.asarray(ra, dtype=np.float64)
+        
+        if _check._VALIDATE:
+            # Comparisons With NaN Are False, So NaN Elements Pass and Propagate
+            if ((tmin > tmean) | (tmean > tmax) | (tmin > tmax)).any():
+                raise ValueError("Tmin, Tmean and Tmax must satisfy Tmin <= Tmean <= Tmax!")
+            
+            if ((ra < 0) | (ra > _RA_MAX)).any():
+                raise ValueError(f"Extraterrestrial Radiation must be between 0 and {_RA_MAX}!")
+        
+        return _hargreaves_samani_ufunc()(tmin, tmax, tmean, ra)
     
     
+    @staticmethod
+    def hargreaves_samani_from_latitude(
+        day_of_year : int,
+        latitude : float,
+        tmin : float,
+        tmax : float,
+        tmean : float,
+        checked : bool = True
+    ) -> float:
+        
+        """
+        Description
+        -----------
+        Estimate Reference Crop Evapotranspiration (ETo) Using the Hargreaves and Samani Method,
+        Computing Extraterrestrial Radiation From Day of The Year and Latitude in a Single Pass.
+        Sin and Cos of Latitude and Solar Declination Are Evaluated Once and Shared Between
+        Equations 21 and 25 in Allen et al (1998). NaN Temperatures Propagate To a NaN Result.
+        **Reference**: Based on Equation 4 in Hargreaves and Samani (1985).
+        
+        Parameters
+        ----------
+        day_of_year : int
+            Day of The Year Between 1 and 366
+        
+        latitude : float
+            Latitude [rad]
+        
+        tmin : float
+            Minimum Daily Temperature [°C]
+        
+        tmax : float
+            Maximum Daily Temperature [°C]
+        
+        tmean : float
+            Mean Daily Temperature [°C]
+        
+        checked : bool
+            Validate Latitude and Temperatures Before Computing (Default True);
+            The Day of The Year Is Always Checked
+            
+        Returns
+        -------
+        ETo : float
+            Reference Crop Evapotranspiration [mm/day]
+        """
+        
+        # Always Checked: a Non-Integer Day Would Otherwise Fail Differently in The
+        # Compiled (Numba TypingError) and Pure-Python (IndexError) Kernels
+        check_julian_day(day_of_year)
+        
+        if checked and _check._VALIDATE:
+            check_latitude_radians(latitude)
+            if tmin > tmean or tmean > tmax or tmin > tmax:
+                raise ValueError("Tmin, Tmean and Tmax must satisfy Tmin <= Tmean <= Tmax!")
+        
+        return _hargreaves_samani_from_latitude_compiled()(day_of_year, latitude, tmin, tmax, tmean)
+    
+    
+    @staticmethod
+    def hargreaves_samani_for_latitude(
+        latitude : float
+    ) -> Callable[[int, float, float, float], float]:
+        
+        """
+        Description
+        -----------
+        Build a Hargreaves and Samani ETo Function For a Fixed Latitude (e.g. One Station).
+        Extraterrestrial Radiation Depends Only on Latitude and Day of The Year, So It Is
+        Tabulated Once For Days 1 to 366 and Each Call Reduces To a Table Lookup.
+        NaN Temperatures Propagate To a NaN Result.
+        **Reference**: Based on Equation 4 in Hargreaves and Samani (1985).
+        
+        Parameters
+        ----------
+        latitude : float
+            Latitude [rad]
+            
+        Returns
+        -------
+        eto : Callable[[int, float, float, float], float]
+            Function of (day_of_year, tmin, tmax, tmean) Returning
+            Reference Crop Evapotranspiration [mm/day]
+        """
+        
+        check_latitude_radians(latitude)
+        
+        # Index 0 Is Unused; a Python List Gives The Fastest Scalar Lookup
+        ra_table = [np.nan] + (
+            extraterrestrial_radiation(_DAYS[1:], latitude) * RADIATION2EVAPORATION
+        ).tolist()
+        
+        def eto(day_of_year, tmin, tmax, tmean):
+            # Always Checked: a Negative Day Would Silently Index From The End of The Table
+            check_julian_day(day_of_year)
+            if _check._VALIDATE:
+                if tmin > tmean or tmean > tmax or tmin > tmax:
+                    raise ValueError("Tmin, Tmean and Tmax must satisfy Tmin <= Tmean <= Tmax!")
+            
+            return 0.0023 * (tmean + 17.8) * sqrt(tmax - tmin) * ra_table[day_of_year]
+        
+        return eto
+    
+    
+    @staticmethod
     def fao56_penman_monteith(
         delta,
         rn,
@@ -93,13 +324,18 @@ class ReferenceEvapotranspiration():
         
         Parameters
         ----------
+        delta : float
+            Slope Vapour Pressure Curve [kPa °C-1].
         
         rn : float
             Net Radiation at Crop Surface [MJ m-2 day-1].
         
         G : float
             Soil Heat Flux Density (G) [MJ m-2 day-1]
-            
+        
+        gamma : float
+            Psychrometric Constant [kPa °C-1].
+        
         tmean : float
             Mean Daily Air Temperature At 2m Height [°C]
         
@@ -111,12 +347,6 @@ class ReferenceEvapotranspiration():
         
         ea : float
             Actual Vapour Pressure [kPa]
-        
-        delta : float
-            Slope Vapour Pressure Curve [kPa °C-1].
-            
-        gamma : float
-            Psychrometric Constant [kPa °C-1].
             
         Returns
         -------
@@ -129,4 +359,67 @@ class ReferenceEvapotranspiration():
         C = delta + gamma * (1 + 0.34 * u2)
         
         return (A + B) / C
-        
\ No newline at end of file
+    
+    
+    @staticmethod
+    def fao56_penman_monteith_array(
+        delta : np.ndarray,
+        rn : np.ndarray,
+        G : np.ndarray,
+        gamma : np.ndarray,
+        tmean : np.ndarray,
+        u2 : np.ndarray,
+        es : np.ndarray,
+        ea : np.ndarray
+    ) -> np.ndarray:
+        
+        """
+        Description
+        -----------
+        Estimate reference evapotranspiration (ETo) using the FAO-56 Penman-Monteith
+        equation for arrays of daily values (e.g. a station time series) in one call.
+        **Reference**: Based on equation 6 in Allen et al (1998).
+        
+        Parameters
+        ----------
+        delta : numpy.ndarray
+            Slope Vapour Pressure Curve [kPa °C-1].
+        
+        rn : numpy.ndarray
+            Net Radiation at Crop Surface [MJ m-2 day-1].
+        
+        G : numpy.ndarray
+            Soil Heat Flux Density (G) [MJ m-2 day-1]
+        
+        gamma : numpy.ndarray
+            Psychrometric Constant [kPa °C-1].
+        
+        tmean : numpy.ndarray
+            Mean Daily Air Temperature At 2m Height [°C]
+        
+        u2 : numpy.ndarray
+            Wind Speed at 2m Height [m s-1].
+        
+        es : numpy.ndarray
+            Saturation Vapour Pressure [kPa].
+        
+        ea : numpy.ndarray
+            Actual Vapour Pressure [kPa]
+            
+        Returns
+        -------
+        ETo : numpy.ndarray
+            Reference Evapotranspiration [mm day-1]
+        """
+        
+        return _fao56_penman_monteith_ufunc()(
+            *(np.asarray(x, dtype=np.float64) for x in (delta, rn, G, gamma, tmean, u2, es, ea))
+        )
+
+
+hargreaves_samani = ReferenceEvapotranspiration.hargreaves_samani
+hargreaves_samani_array = ReferenceEvapotranspiration.hargreaves_samani_array
+hargreaves_samani_from_latitude = ReferenceEvapotranspiration.hargreaves_samani_from_latitude
+hargreaves_samani_for_latitude = ReferenceEvapotranspiration.hargreaves_samani_for_latitude
+fao56_penman_monteith = ReferenceEvapotranspiration.fao56_penman_monteith
+fao56_penman_monteith_array = ReferenceEvapotranspiration.fao56_penman_monteith_array
@@ -51,5 +51,8 @@ setup(
         'GeoAlchemy2',
         'persiantools',
         'pytest',
-    ]
+    ],
+    extras_require={
+        'numba': ['numba'],
+    }
 )
\ No newline at end of file
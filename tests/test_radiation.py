@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+import pytest
+
+import qdwb
+from qdwb.convert import convert_degrees2radians
+
+
+LATITUDE = convert_degrees2radians(-20.0)
+
+
+def test_extraterrestrial_radiation_fao56_example_8():
+    # Example 8 in Allen et al (1998): 3 September (Day 246) at 20°S
+    assert qdwb.solar_declination(246) == pytest.approx(0.120, abs=1e-3)
+    assert qdwb.inverse_relative_distance_earth_sun(246) == pytest.approx(0.985, abs=1e-3)
+    assert qdwb.extraterrestrial_radiation(246, LATITUDE) == pytest.approx(32.2, abs=0.05)
+
+
+def test_array_matches_scalar():
+    days = np.arange(1, 367)
+    latitudes = np.linspace(-1.5, 1.5, days.size)
+    
+    expected = [qdwb.extraterrestrial_radiation(int(d), float(lat)) for d, lat in zip(days, latitudes)]
+    
+    np.testing.assert_allclose(qdwb.extraterrestrial_radiation(days, latitudes), expected)
+    np.testing.assert_allclose(
+        qdwb.solar_declination(days),
+        0.409 * np.sin(2.0 * math.pi / 365.0 * days - 1.39)
+    )
+
+
+def test_composed_terms_match_extraterrestrial_radiation():
+    solar_dec = qdwb.solar_declination(246)
+    sha = qdwb.sunset_hour_angle(LATITUDE, solar_dec)
+    ra = (24.0 * 60.0) / math.pi * qdwb.SOLAR_CONSTANT * qdwb.inverse_relative_distance_earth_sun(246) * (
+        sha * math.sin(LATITUDE) * math.sin(solar_dec) +
+        math.cos(LATITUDE) * math.cos(solar_dec) * math.sin(sha)
+    )
+    
+    assert qdwb.extraterrestrial_radiation(246, LATITUDE) == pytest.approx(ra)
+
+
+def test_radiation_module_is_not_shadowed():
+    import qdwb.radiation as radiation
+    
+    assert radiation.extraterrestrial_radiation is qdwb.extraterrestrial_radiation
+
+
+@pytest.mark.parametrize("day_of_year", [0, 367, -1, 100.5, True, np.array([1, 400]), np.array([1.0, 2.0])])
+def test_invalid_day_of_year(day_of_year):
+    with pytest.raises(ValueError):
+        qdwb.extraterrestrial_radiation(day_of_year, LATITUDE)
+
+
+@pytest.mark.parametrize("day_of_year", [0, -1, 367])
+def test_day_of_year_checked_without_validation(monkeypatch, day_of_year):
+    monkeypatch.setattr(qdwb.check, "_VALIDATE", False)
+    
+    with pytest.raises(ValueError):
+        qdwb.solar_declination(day_of_year)
+    with pytest.raises(ValueError):
+        qdwb.extraterrestrial_radiation(day_of_year, LATITUDE)
+
+
+@pytest.mark.parametrize("latitude", [2.0, -1.6, np.array([0.0, 1.6])])
+def test_invalid_latitude(latitude):
+    with pytest.raises(ValueError):
+        qdwb.extraterrestrial_radiation(100, latitude)
@@ -0,0 +1,190 @@
+import json
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import qdwb
+from qdwb.convert import convert_degrees2radians, convert_radiation2evaporation
+
+
+LATITUDE = convert_degrees2radians(-20.0)
+
+# Evaluates Every Kernel That Has a Numba and a Pure NumPy/Python Variant
+_DUAL_PATH_SCRIPT = """
+import json, sys
+{setup}
+import numpy as np
+import qdwb
+from qdwb.convert import convert_radiation2evaporation
+R = qdwb.ReferenceEvapotranspiration
+days = np.arange(1, 367)
+tmin = 10.0 + 5.0 * np.sin(days / 58.0)
+tmax = tmin + 12.0
+tmean = tmin + 6.0
+ra = convert_radiation2evaporation(qdwb.extraterrestrial_radiation(days, 0.6))
+print(json.dumps({{
+    "fused": [R.hargreaves_samani_from_latitude(int(d), 0.6, a, b, c) for d, a, b, c in zip(days, tmin, tmax, tmean)],
+    "array": R.hargreaves_samani_array(tmin, tmax, tmean, ra).tolist(),
+    "pm": R.fao56_penman_monteith_array(0.122, 13.28 + tmin / 10.0, 0.0, 0.066, tmean, 2.078, 1.997, 1.409).tolist(),
+}}))
+"""
+
+
+def _run_dual_path_script(setup):
+    output = subprocess.run(
+        [sys.executable, "-c", _DUAL_PATH_SCRIPT.format(setup=setup)],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_hargreaves_samani_paths_agree():
+    ra = convert_radiation2evaporation(qdwb.extraterrestrial_radiation(246, LATITUDE))
+    expected = qdwb.ReferenceEvapotranspiration.hargreaves_samani(tmin=20, tmax=30, tmean=25, ra=ra)
+    
+    assert qdwb.ReferenceEvapotranspiration.hargreaves_samani_from_latitude(246, LATITUDE, 20, 30, 25) == pytest.approx(expected)
+    assert qdwb.ReferenceEvapotranspiration.hargreaves_samani_for_latitude(LATITUDE)(246, 20, 30, 25) == pytest.approx(expected)
+    assert qdwb.ReferenceEvapotranspiration().hargreaves_samani(20, 30, 25, ra) == expected
+    assert qdwb.hargreaves_samani(20, 30, 25, ra) == expected
+
+
+def test_hargreaves_samani_array_matches_scalar():
+    days = np.arange(1, 367)
+    tmin = np.full(days.size, 18.0)
+    tmax = tmin + 11.0
+    tmean = tmin + 4.0
+    ra = convert_radiation2evaporation(qdwb.extraterrestrial_radiation(days, LATITUDE))
+    
+    expected = [qdwb.ReferenceEvapotranspiration.hargreaves_samani(a, b, c, r) for a, b, c, r in zip(tmin, tmax, tmean, ra)]
+    
+    np.testing.assert_allclose(qdwb.ReferenceEvapotranspiration.hargreaves_samani_array(tmin, tmax, tmean, ra), expected)
+
+
+@pytest.mark.parametrize("tmin, tmax, tmean, ra", [
+    (np.nan, 20.0, 15.0, 10.0),
+    (10.0, np.nan, 15.0, 10.0),
+    (10.0, 20.0, np.nan, 10.0),
+    (10.0, 20.0, 15.0, np.nan),
+])
+def test_hargreaves_samani_propagates_nan(tmin, tmax, tmean, ra):
+    # Same NaN Policy As hargreaves_samani_array
+    assert math.isnan(qdwb.ReferenceEvapotranspiration.hargreaves_samani(tmin, tmax, tmean, ra))
+    if not math.isnan(ra):
+        assert math.isnan(qdwb.ReferenceEvapotranspiration.hargreaves_samani_from_latitude(100, 0.6, tmin, tmax, tmean))
+        assert math.isnan(qdwb.ReferenceEvapotranspiration.hargreaves_samani_for_latitude(0.6)(100, tmin, tmax, tmean))
+
+
+def test_hargreaves_samani_array_propagates_nan():
+    eto = qdwb.ReferenceEvapotranspiration.hargreaves_samani_array(
+        [10.0, np.nan, 10.0, 10.0],
+        [20.0, 20.0, 20.0, 20.0],
+        [15.0, 15.0, np.nan, 15.0],
+        [10.0, 10.0, 10.0, np.nan]
+    )
+    
+    assert not math.isnan(eto[0])
+    assert np.isnan(eto[1:]).all()
+
+
+def test_fao56_penman_monteith_array_matches_scalar():
+    # Example 18 in Allen et al (1998)
+    kwargs = dict(delta=0.122, rn=13.28, G=0.0, gamma=0.066, tmean=16.9, u2=2.078, es=1.997, ea=1.409)
+    
+    expected = qdwb.ReferenceEvapotranspiration.fao56_penman_monteith(**kwargs)
+    
+    assert expected == pytest.approx(3.9, abs=0.05)
+    np.testing.assert_allclose(
+        qdwb.ReferenceEvapotranspiration.fao56_penman_monteith_array(**{k: np.full(3, v) for k, v in kwargs.items()}),
+        np.full(3, expected)
+    )
+
+
+def test_import_does_not_load_numba():
+    script = "import sys, qdwb; qdwb.hargreaves_samani(20, 30, 25, 16); print('numba' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    
+    assert output.strip() == "False"
+
+
+def test_numba_and_fallback_paths_are_identical():
+    pytest.importorskip("numba")
+    
+    compiled = _run_dual_path_script("")
+    fallback = _run_dual_path_script("sys.modules['numba'] = None")
+    
+    for name in compiled:
+        np.testing.assert_allclose(compiled[name], fallback[name], rtol=1e-12, err_msg=name)
+
+
+@pytest.mark.parametrize("tmin, tmax, tmean, ra", [
+    (30, 20, 25, 10),
+    (20, 30, 35, 10),
+    (20, 30, 15, 10),
+    (20, 30, 25, -1),
+    (20, 30, 25, 60),
+    (30, 20, float("nan"), 10),
+])
+def test_hargreaves_samani_invalid_inputs(tmin, tmax, tmean, ra):
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani(tmin, tmax, tmean, ra)
+
+
+def test_validation_can_be_disabled_at_runtime(monkeypatch):
+    monkeypatch.setattr(qdwb.check, "_VALIDATE", False)
+    
+    assert qdwb.ReferenceEvapotranspiration.hargreaves_samani(20, 30, 25, 60) > 0
+
+
+def test_hargreaves_samani_array_invalid_inputs():
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani_array([20.0, 30.0], [30.0, 20.0], [25.0, 25.0], [10.0, 10.0])
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani_array([20.0], [30.0], [25.0], [60.0])
+    # Tmin > Tmax Must Be Caught Even When Tmean Is NaN
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani_array([30.0], [20.0], [np.nan], [10.0])
+
+
+@pytest.mark.parametrize("checked", [True, False])
+@pytest.mark.parametrize("day_of_year", [0, 367, 100000, -1, 100.5, True])
+def test_hargreaves_samani_from_latitude_invalid_day(day_of_year, checked):
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani_from_latitude(day_of_year, 0.6, 10, 20, 15, checked=checked)
+
+
+def test_hargreaves_samani_for_latitude_invalid_inputs():
+    eto = qdwb.ReferenceEvapotranspiration.hargreaves_samani_for_latitude(0.6)
+    
+    for args in [(0, 10, 20, 15), (100.5, 10, 20, 15), (100, 20, 10, 15)]:
+        with pytest.raises(ValueError):
+            eto(*args)
+    
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani_for_latitude(2.0)
+
+
+@pytest.mark.parametrize("day_of_year", [0, -1, 367])
+def test_hargreaves_samani_for_latitude_day_checked_without_validation(monkeypatch, day_of_year):
+    monkeypatch.setattr(qdwb.check, "_VALIDATE", False)
+    
+    with pytest.raises(ValueError):
+        qdwb.ReferenceEvapotranspiration.hargreaves_samani_for_latitude(0.6)(day_of_year, 10, 20, 15)
+
+
+def test_package_namespace_has_no_helpers():
+    for name in ("np", "math", "os", "sin", "sqrt", "njit", "vectorize", "Callable"):
+        assert not hasattr(qdwb, name), name
+    assert qdwb.SOLAR_CONSTANT == 0.0820